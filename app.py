@@ -1,36 +1,14 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import numpy as np
 
+from utils import (
+    ELASTICITY, OPTIMAL_P, load_data, price_simulator, return_stats, build_return_box
+)
+
 # --- 1. PAGE CONFIGURATION ---
 st.set_page_config(page_title="Retail Price Optimizer", layout="wide")
 
-# --- 2. DATA LOADING LOGIC ---
-@st.cache_data
-def load_data(file_source):
-    if file_source == "Default: Fashion Boutique":
-        return pd.read_csv("fashion_boutique_dataset.csv")
-    elif file_source == "Tech Sales (Placeholder)":
-        return pd.DataFrame({
-            "category": ["Electronics", "Electronics", "Mobile"],
-            "item": ["Laptop", "Tablet", "Phone"], 
-            "current_price": [1200, 600, 800], 
-            "markdown_percentage": [5, 10, 0], 
-            "is_returned": [False, True, False]
-        })
-    elif file_source == "Grocery Data (Placeholder)":
-        return pd.DataFrame({
-            "category": ["Produce", "Produce", "Dairy"],
-            "item": ["Apple", "Orange", "Milk"], 
-            "current_price": [2, 3, 4], 
-            "markdown_percentage": [0, 20, 0], 
-            "is_returned": [False, False, False]
-        })
-    else:
-        return pd.read_csv(file_source)
-
-# --- 3. SIDEBAR SELECTION ---
+# --- 2. SIDEBAR SELECTION ---
 with st.sidebar:
     st.markdown("**DATA SELECTION**")
     data_option = st.selectbox(
@@ -46,11 +24,10 @@ with st.sidebar:
 # Load final data based on selection or upload
 df = load_data(uploaded_file if uploaded_file else data_option)
 
-# Data Cleaning
-if 'is_returned' in df.columns:
-    df['is_returned'] = df['is_returned'].fillna(False)
+# Refreshed on every full run so it always matches the selected dataset
+st.session_state['cols'] = frozenset(df.columns)
 
-# --- 4. MAIN BODY HEADLINES & GUIDE ---
+# --- 3. MAIN BODY HEADLINES & GUIDE ---
 st.markdown("# REVENUE AND PRICE OPTIMIZATION STRATEGY")
 st.markdown("---")
 
@@ -64,94 +41,24 @@ st.markdown("""
 """)
 
 # Key Metrics Display
-if 'current_price' in df.columns:
-    total_revenue = df['current_price'].sum()
+if 'current_price' in st.session_state['cols']:
+    # Prices arrive as float32 (see load_data); rounding to integer cents makes the sum exact
+    prices = df['current_price'].to_numpy(dtype=np.float64)
+    # Skip missing prices (blank cells in uploaded CSVs), as the pandas sum did
+    prices = prices[~np.isnan(prices)]
+    total_cents = int(np.rint(prices * 100).astype(np.int64).sum())
+    total_revenue = total_cents / 100
     m1, m2 = st.columns(2)
     m1.metric("Current Total Revenue", f"${total_revenue:,.2f}")
     m2.metric("Data Records Analyzed", f"{len(df):,}")
 
-# --- 5. SIMULATION & OPTIMIZATION LOGIC ---
+# --- 4. SIMULATION & OPTIMIZATION LOGIC ---
 st.markdown("---")
 st.markdown("### **PRICE ELASTICITY SIMULATOR**")
 
-elasticity = -1.6 
-optimal_p = round(-50 * (1 + elasticity) / elasticity, 2)
-
-# Session State Initialization
-if 'current_slider_val' not in st.session_state:
-    st.session_state.current_slider_val = 0.0
-
-col_sim1, col_sim2 = st.columns([1, 2])
-
-with col_sim1:
-    st.markdown("**SIMULATION CONTROLS**")
-    
-    # THE SLIDER
-    price_change = st.slider(
-        "Target Price Adjustment (%)", 
-        min_value=-50.0, 
-        max_value=50.0, 
-        step=0.5,
-        value=st.session_state.current_slider_val
-    )
-    
-    st.session_state.current_slider_val = price_change
-
-    st.markdown("---")
-
-    # THE OPTIMIZATION BUTTON
-    if st.button("RUN REVENUE OPTIMIZATION"):
-        st.session_state.current_slider_val = optimal_p
-        st.rerun()
+price_simulator(total_revenue, ELASTICITY, OPTIMAL_P)
 
-    st.caption(f"""
-    **STRATEGIC OPTIMIZATION:** Click the button above to automatically move the slider to the best price point. 
-    This finds the exact balance where we make the most money before customers start buying less.
-    """)
-    
-    # Impact Calculations
-    demand_impact = (price_change * elasticity) / 100
-    new_revenue = total_revenue * (1 + (price_change/100)) * (1 + demand_impact)
-    revenue_delta = new_revenue - total_revenue
-    
-    # Return Risk Logic
-    return_risk = "LOW"
-    risk_msg = "Stable return patterns expected."
-    if price_change < -25:
-        return_risk = "HIGH"
-        risk_msg = "Deep discounts historically increase returns due to impulse buying."
-
-with col_sim2:
-    st.markdown("**EXECUTIVE IMPACT SUMMARY**")
-    
-    direction = "increase" if demand_impact > 0 else "decrease"
-    change_type = "extra" if revenue_delta >= 0 else "loss of"
-    
-    # One-Sentence Summary
-    st.info(f"**ONE-SENTENCE SUMMARY (Updates with slider):** By adjusting our price by **{price_change}%**, we expect sales volume to **{direction}** by **{abs(demand_impact * 100):.1f}%**, resulting in total revenue of **${new_revenue:,.2f}** (a **{change_type} ${abs(revenue_delta):,.2f}** vs. current).")
-
-    # Detailed Bullets
-    st.markdown(f"""
-    * **Target Price Change:** `{price_change}%`
-    * **Predicted Volume Shift:** `{ (demand_impact * 100):.1f}%`
-    * **New Projected Total:** `${new_revenue:,.2f} ({"+" if revenue_delta >= 0 else ""}${revenue_delta:,.2f} vs current)`
-    * **Return Risk Level:** `{return_risk}` ({risk_msg})
-    """)
-    st.markdown("---")
-
-    # Revenue Curve Visualization
-    sim_prices = np.linspace(-50, 50, 50)
-    sim_revs = [total_revenue * (1 + p/100) * (1 + (p * elasticity / 100)) for p in sim_prices]
-    
-    fig_curve = px.line(x=sim_prices, y=sim_revs, 
-                        labels={'x': 'Price Change %', 'y': 'Revenue ($)'}, 
-                        title="REVENUE OPTIMIZATION CURVE")
-    
-    fig_curve.add_vline(x=price_change, line_dash="dash", line_color="red", annotation_text="Selection")
-    fig_curve.add_vline(x=optimal_p, line_dash="dot", line_color="green", annotation_text="Peak")
-    st.plotly_chart(fig_curve, use_container_width=True)
-
-# --- 6. RETURN LOGISTICS ANALYSIS ---
+# --- 5. RETURN LOGISTICS ANALYSIS ---
 st.markdown("---")
 st.markdown("### **RETURN LOGISTICS ANALYSIS**")
 
@@ -163,25 +70,18 @@ st.markdown("""
 """)
 
 
-
-if 'is_returned' in df.columns and 'category' in df.columns:
-    return_rate = (df['is_returned'].sum() / len(df)) * 100
-    cat_returns = df.groupby('category')['is_returned'].mean().sort_values(ascending=False)
-    top_cat = cat_returns.index[0]
-    top_rate = cat_returns.values[0] * 100
+if 'is_returned' in st.session_state['cols'] and 'category' in st.session_state['cols']:
+    stats = return_stats(df)
 
     st.info(f"""
-    **CURRENT DATA SUMMARY:** Our overall rate of return across all categories is **{return_rate:.1f}%**. 
-    The highest return rate is currently in the **{top_cat}** category, where items are returned at a rate of **{top_rate:.1f}%**. 
+    **CURRENT DATA SUMMARY:** Our overall rate of return across all categories is **{stats['return_rate']:.1f}%**. 
+    The highest return rate is currently in the **{stats['top_cat']}** category, where items are returned at a rate of **{stats['top_rate']:.1f}%**. 
     *This summary refreshes automatically whenever new data is selected or uploaded.*
     """)
 
-    fig_box = px.box(df, x='category', y='markdown_percentage', color='is_returned',
-                     title="HOW MARKDOWNS IMPACT RETURNS BY CATEGORY",
-                     labels={'markdown_percentage': 'Markdown %', 'category': 'Product Group'})
-    
+    fig_box = build_return_box(df)
     st.plotly_chart(fig_box, use_container_width=True)
 
-# --- 7. FOOTER ---
+# --- 6. FOOTER ---
 st.markdown("---")
 st.caption("Developed by Bree Thomas | Data Business Analyst Portfolio | 2025")
@@ -0,0 +1,198 @@
+"""Cached data loading, simulation and chart helpers for the Retail Price Optimizer."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Simulation constants (fixed for the app, so computed once at import)
+ELASTICITY = -1.6
+OPTIMAL_P = round(-50 * (1 + ELASTICITY) / ELASTICITY, 2)
+SIM_PRICES = np.linspace(-50.0, 50.0, 50, dtype=np.float32)
+
+# --- DATA LOADING ---
+PLACEHOLDER_DTYPES = {
+    "category": "category",
+    "current_price": "float32",
+    "markdown_percentage": "float32",
+    "is_returned": "bool",
+}
+
+_TECH_DF = pd.DataFrame({
+    "category": ["Electronics", "Electronics", "Mobile"],
+    "item": ["Laptop", "Tablet", "Phone"], 
+    "current_price": [1200, 600, 800], 
+    "markdown_percentage": [5, 10, 0], 
+    "is_returned": [False, True, False]
+}).astype(PLACEHOLDER_DTYPES)
+
+_GROCERY_DF = pd.DataFrame({
+    "category": ["Produce", "Produce", "Dairy"],
+    "item": ["Apple", "Orange", "Milk"], 
+    "current_price": [2, 3, 4], 
+    "markdown_percentage": [0, 20, 0], 
+    "is_returned": [False, False, False]
+}).astype(PLACEHOLDER_DTYPES)
+
+# Shared by reference across reruns, so the returned frame must never be mutated
+@st.cache_resource
+def load_data(file_source):
+    if file_source == "Default: Fashion Boutique":
+        df = pd.read_csv(
+            "fashion_boutique_dataset.csv",
+            usecols=["category", "current_price", "markdown_percentage", "is_returned", "purchase_date"],
+            dtype={"current_price": "float32", "markdown_percentage": "float32",
+                   "is_returned": "boolean", "category": "category"},
+            parse_dates=["purchase_date"]
+        )
+    elif file_source == "Tech Sales (Placeholder)":
+        return _TECH_DF
+    elif file_source == "Grocery Data (Placeholder)":
+        return _GROCERY_DF
+    else:
+        df = pd.read_csv(file_source)
+
+    # Data Cleaning
+    if 'is_returned' in df.columns:
+        df['is_returned'] = df['is_returned'].fillna(False).astype(bool)
+    return df
+
+# --- SIMULATION & OPTIMIZATION ---
+if njit is not None:
+    @njit(cache=True)
+    def revenue_curve(prices, total_revenue, elasticity, out):
+        for i in range(prices.size):
+            p = prices[i]
+            out[i] = total_revenue * (1 + p * 0.01) * (1 + p * elasticity * 0.01)
+else:
+    def revenue_curve(prices, total_revenue, elasticity, out):
+        np.multiply(total_revenue * (1 + prices/100), 1 + prices * elasticity / 100, out=out)
+
+@st.cache_data
+def build_revenue_curve(total_revenue, elasticity):
+    # float32 output halves the JSON sent to the browser
+    sim_revs = np.empty_like(SIM_PRICES, dtype=np.float32)
+    revenue_curve(SIM_PRICES, float(total_revenue), elasticity, sim_revs)
+    return SIM_PRICES, sim_revs
+
+_RISK_THRESHOLDS = np.array([-25.0])
+_RISK_LEVELS = [
+    ("HIGH", "Deep discounts historically increase returns due to impulse buying."),
+    ("LOW", "Stable return patterns expected."),
+]
+
+def compute_impact(price_change, total_revenue, elasticity):
+    demand_impact = (price_change * elasticity) / 100
+    new_revenue = total_revenue * (1 + (price_change/100)) * (1 + demand_impact)
+    revenue_delta = new_revenue - total_revenue
+    
+    # Return Risk Logic: band i covers price changes below _RISK_THRESHOLDS[i]
+    return_risk, risk_msg = _RISK_LEVELS[int(np.searchsorted(_RISK_THRESHOLDS, price_change, side="right"))]
+    return demand_impact, new_revenue, revenue_delta, return_risk, risk_msg
+
+@st.cache_data
+def build_curve_fig(total_revenue, elasticity, optimal_p):
+    # Base figure only; the slider-dependent "Selection" line is added per rerun
+    sim_prices, sim_revs = build_revenue_curve(total_revenue, elasticity)
+    fig = px.line(x=sim_prices, y=sim_revs, 
+                  labels={'x': 'Price Change %', 'y': 'Revenue ($)'}, 
+                  title="REVENUE OPTIMIZATION CURVE")
+    fig.add_vline(x=optimal_p, line_dash="dot", line_color="green", annotation_text="Peak")
+    return fig
+
+# Only this section reruns when the slider or optimization button is used
+@st.fragment
+def price_simulator(total_revenue, elasticity, optimal_p):
+    # Session State Initialization
+    if 'current_slider_val' not in st.session_state:
+        st.session_state.current_slider_val = 0.0
+
+    col_sim1, col_sim2 = st.columns([1, 2])
+
+    with col_sim1:
+        st.markdown("**SIMULATION CONTROLS**")
+    
+        # THE SLIDER
+        price_change = st.slider(
+            "Target Price Adjustment (%)", 
+            min_value=-50.0, 
+            max_value=50.0, 
+            step=0.5,
+            value=st.session_state.current_slider_val
+        )
+    
+        st.session_state.current_slider_val = price_change
+
+        st.markdown("---")
+
+        # THE OPTIMIZATION BUTTON
+        if st.button("RUN REVENUE OPTIMIZATION"):
+            st.session_state.current_slider_val = optimal_p
+            st.rerun(scope="fragment")
+
+        st.caption(f"""
+        **STRATEGIC OPTIMIZATION:** Click the button above to automatically move the slider to the best price point. 
+        This finds the exact balance where we make the most money before customers start buying less.
+        """)
+    
+        # Impact Calculations
+        demand_impact, new_revenue, revenue_delta, return_risk, risk_msg = compute_impact(
+            price_change, total_revenue, elasticity
+        )
+
+    with col_sim2:
+        st.markdown("**EXECUTIVE IMPACT SUMMARY**")
+    
+        direction = "increase" if demand_impact > 0 else "decrease"
+        change_type = "extra" if revenue_delta >= 0 else "loss of"
+    
+        # One-Sentence Summary
+        st.info(f"**ONE-SENTENCE SUMMARY (Updates with slider):** By adjusting our price by **{price_change}%**, we expect sales volume to **{direction}** by **{abs(demand_impact * 100):.1f}%**, resulting in total revenue of **${new_revenue:,.2f}** (a **{change_type} ${abs(revenue_delta):,.2f}** vs. current).")
+
+        # Detailed Bullets
+        st.markdown(f"""
+        * **Target Price Change:** `{price_change}%`
+        * **Predicted Volume Shift:** `{ (demand_impact * 100):.1f}%`
+        * **New Projected Total:** `${new_revenue:,.2f} ({"+" if revenue_delta >= 0 else ""}${revenue_delta:,.2f} vs current)`
+        * **Return Risk Level:** `{return_risk}` ({risk_msg})
+        """)
+        st.markdown("---")
+
+        # Revenue Curve Visualization
+        # cache_data hands back a fresh copy, so the base figure can be patched directly
+        fig_curve = build_curve_fig(total_revenue, elasticity, optimal_p)
+        fig_curve.add_vline(x=price_change, line_dash="dash", line_color="red", annotation_text="Selection")
+        st.plotly_chart(fig_curve, use_container_width=True)
+
+
+# --- RETURN LOGISTICS ---
+@st.cache_data
+def return_stats(df):
+    # Per-category return rate straight from the categorical codes (NaN categories have code -1)
+    cats = df['category'].astype('category')
+    codes = cats.cat.codes.to_numpy()
+    returned = df['is_returned'].to_numpy(dtype=np.float32)
+    valid = codes >= 0
+    n_cats = len(cats.cat.categories)
+    sums = np.bincount(codes[valid], weights=returned[valid], minlength=n_cats)
+    counts = np.bincount(codes[valid], minlength=n_cats)
+    present = counts > 0
+    rates = sums[present] / counts[present]
+    order = np.argsort(-rates, kind="stable")
+    cat_returns = pd.Series(rates[order], index=cats.cat.categories[present][order])
+    return {
+        "return_rate": np.count_nonzero(df['is_returned'].to_numpy()) / len(df) * 100,
+        "top_cat": cat_returns.index[0],
+        "top_rate": cat_returns.values[0] * 100,
+        "cat_returns": cat_returns,
+    }
+
+@st.cache_data
+def build_return_box(df):
+    return px.box(df, x='category', y='markdown_percentage', color='is_returned',
+                  title="HOW MARKDOWNS IMPACT RETURNS BY CATEGORY",
+                  labels={'markdown_percentage': 'Markdown %', 'category': 'Product Group'})